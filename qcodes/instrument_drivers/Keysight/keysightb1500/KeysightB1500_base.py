@@ -71,6 +71,11 @@ class KeysightB1500(VisaInstrument):
         Extend write method from the super to ask for error message each
         time a write command is called.
         """
+        # Any write may change settings that the modules cache from
+        # ``*LRN?`` queries -- including mainframe-wide ones such as
+        # ``*RST`` -- so invalidate every module's cached state.
+        for module in self.by_slot.values():
+            module._config_seq += 1
         super().write(cmd)
         error_message = self.error_message()
         if error_message != '+0,"No Error."':
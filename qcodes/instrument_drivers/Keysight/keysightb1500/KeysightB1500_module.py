@@ -1,5 +1,7 @@
 import re
-from typing import Optional, Tuple, TYPE_CHECKING, Dict, Union, cast, Any
+from contextlib import contextmanager
+from typing import (Optional, Tuple, TYPE_CHECKING, Dict, Iterator, List,
+                    Union, cast, Any)
 from typing_extensions import TypedDict
 from collections import namedtuple
 import numpy as np
@@ -291,6 +293,17 @@ class B1500Module(InstrumentChannel):
         self.channels: Tuple[ChNr, ...]
         self.slot_nr = SlotNr(slot_nr)
 
+        # Commands accumulated inside a ``batched`` block, or ``None``
+        # outside of one.
+        self._pending_writes: Optional[List[str]] = None
+
+        # Sequence number of the last configuration change that may
+        # affect this module. It is bumped on every write through the
+        # module itself and on every write through the mainframe (many
+        # settings, e.g. ``WT`` or ``*RST``, are mainframe-wide), and
+        # caches of ``*LRN?``-derived state are keyed on it.
+        self._config_seq: int = 0
+
         if name is None:
             number = len(parent.by_kind[self.MODULE_KIND]) + 1
             name = self.MODULE_KIND.lower() + str(number)
@@ -301,6 +314,44 @@ class B1500Module(InstrumentChannel):
     parse_spot_measurement_response = parse_spot_measurement_response
     parse_module_query_response = parse_module_query_response
 
+    def write(self, cmd: str) -> None:
+        if self._pending_writes is not None:
+            self._pending_writes.append(cmd)
+        else:
+            super().write(cmd)
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """
+        Context manager that batches the commands written by this module.
+
+        Within the context, commands are accumulated instead of being
+        sent to the instrument; on exit they are sent as one
+        semicolon-separated message, so a fixed setup sequence costs a
+        single round-trip instead of one per command. The commands on the
+        wire are unchanged.
+
+        Example:
+
+            ::
+
+                with smu.batched():
+                    smu.use_high_speed_adc()
+                    smu.timing_parameters(0.0, 0.002, 100)
+                    smu.measurement_mode(constants.MM.Mode.SAMPLING)
+        """
+        if self._pending_writes is not None:
+            raise RuntimeError('Already inside a batched block of '
+                               f'{self.full_name}.')
+        self._pending_writes = []
+        try:
+            yield
+            pending = self._pending_writes
+        finally:
+            self._pending_writes = None
+        if pending:
+            self.write(';'.join(pending))
+
     def enable_outputs(self) -> None:
         """
         Enables all outputs of this module by closing the output relays of its
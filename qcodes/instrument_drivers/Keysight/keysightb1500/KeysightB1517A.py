@@ -1,5 +1,4 @@
 import re
-import textwrap
 from typing import Optional, Dict, Any, Union, TYPE_CHECKING, List, Tuple, \
     cast, Sequence
 from typing_extensions import TypedDict, Literal, overload
@@ -23,6 +22,55 @@ if TYPE_CHECKING:
     from .KeysightB1500_base import KeysightB1500
 
 
+# The ``*LRN?`` responses follow a fixed grammar of semicolon-separated
+# records, so they are parsed with plain string operations instead of
+# regular expressions. Set to ``False`` to fall back to the equivalent
+# regex-based parsing.
+_FAST_PARSE = True
+
+# Patterns for the individual records of the ``*LRN?`` responses,
+# compiled once at module load since the parsers using them are called
+# on every snapshot.
+_WT_RE = re.compile('WT(?P<hold_time>.+?),(?P<delay>.+?),'
+                    '(?P<step_delay>.+?),(?P<trigger_delay>.+?),'
+                    '(?P<measure_delay>.+?)(;|$)')
+
+# Fixed template of the sweep delay set command; the actual command is
+# assembled positionally in ``_SweepDelaysGroup._set_from_dict``.
+_WT_SET_CMD = 'WT {hold_time},{delay},{step_delay},{trigger_delay},' \
+              '{measure_delay}'
+_RI_RE = re.compile(r'RI (.+?),(.+?)($|;)')
+_CMM_RE = re.compile(r'CMM (.+?),(.+?)($|;)')
+
+# Value-to-member lookup tables for the enums constructed per record in
+# the LRN response parsers; a plain dict lookup is much cheaper than
+# going through ``IntEnum.__call__`` for every channel.
+_CHNR_BY_VALUE = {member.value: member for member in constants.ChNr}
+_IMEAS_RANGE_BY_VALUE = {member.value: member
+                         for member in constants.IMeasRange}
+_CMM_MODE_BY_VALUE = {member.value: member for member in constants.CMM.Mode}
+
+# Default output ranges applied when forcing without a prior
+# source_config call; bound once here since enum attribute access goes
+# through EnumMeta.__getattr__ and the force path is called often.
+_V_OUTPUT_RANGE_AUTO = constants.VOutputRange.AUTO
+_I_OUTPUT_RANGE_AUTO = constants.IOutputRange.AUTO
+
+# Combined ``*LRN?`` query which the SMU uses to learn all of its
+# configuration state in a single transaction, see ``B1517A._get_status``.
+# Note that ``lrn_query`` is a final command, hence the individual queries
+# are composed into one message here instead of chaining them on a single
+# ``MessageBuilder``.
+_STATUS_QUERY = ';'.join(
+    MessageBuilder().lrn_query(type_id=type_id).message
+    for type_id in (
+        constants.LRN.Type.MEASUREMENT_RANGING_STATUS,
+        constants.LRN.Type.SMU_MEASUREMENT_OPERATION,
+        constants.LRN.Type.STAIRCASE_SWEEP_MEASUREMENT_SETTINGS,
+    )
+)
+
+
 class SweepSteps(TypedDict, total=False):
     """
     A dictionary holding all the parameters that specifies the staircase
@@ -38,6 +86,42 @@ class SweepSteps(TypedDict, total=False):
     power_compliance: Optional[float]
 
 
+class _SweepDelaysGroup(Group):
+    """
+    A :class:`.Group` for the sweep delay (``WT``) parameters which updates
+    its members from the batched ``*LRN?`` snapshot of the parent SMU (see
+    :meth:`B1517A._get_status`) instead of issuing a separate query of its
+    own per update.
+    """
+
+    def __init__(self, smu: 'B1517A', parameters: List[GroupParameter],
+                 *args: Any, **kwargs: Any) -> None:
+        self._smu = smu
+        # The members and their order are fixed, so the ``WT`` command can
+        # be assembled with a plain join instead of re-tokenising the
+        # format-string template on every set.
+        self._field_names = tuple(p.name for p in parameters)
+        super().__init__(parameters, *args, **kwargs)
+
+    def update(self) -> None:
+        ret = self.get_parser(self._smu._get_status())
+        for name, p in list(self.parameters.items()):
+            p.cache._set_from_raw_value(ret[name])
+
+    def _set_from_dict(self, calling_dict: Dict[str, ParamRawDataType]) -> None:
+        command_str = 'WT ' + ','.join(
+            str(calling_dict[name]) for name in self._field_names)
+        if self.instrument is None:
+            raise RuntimeError("Trying to set GroupParameter not attached "
+                               "to any instrument.")
+        self.instrument.write(command_str)
+        for name, p in list(self.parameters.items()):
+            p.cache._set_from_raw_value(calling_dict[name])
+        # The group writes via the root instrument, bypassing the SMU's
+        # ``write``, so invalidate the SMU's cached snapshot explicitly.
+        self._smu._config_seq += 1
+
+
 class IVSweeper(InstrumentChannel):
     def __init__(self, parent: 'B1517A',
                  name: str, **kwargs: Any):
@@ -58,24 +142,24 @@ class IVSweeper(InstrumentChannel):
                            get_parser=constants.Abort,
                            vals=vals.Enum(*list(constants.Abort)),
                            initial_cache_value=constants.Abort.ENABLED,
-                           docstring=textwrap.dedent("""
-        The WM command enables or disables the automatic abort function for
-        the staircase sweep sources and the pulsed sweep source. The
-        automatic abort function stops the measurement when one of the
-        following conditions occurs:
-         - Compliance on the measurement channel
-         - Compliance on the non-measurement channel
-         - Overflow on the AD converter
-         - Oscillation on any channel
-        This command also sets the post measurement condition for the sweep
-        sources. After the measurement is normally completed, the staircase
-        sweep sources force the value specified by the post parameter,
-        and the pulsed sweep source forces the pulse base value.
-
-        If the measurement is stopped by the automatic abort function,
-        the staircase sweep sources force the start value, and the pulsed
-        sweep source forces the pulse base value after sweep.
-        """))
+                           docstring="""
+The WM command enables or disables the automatic abort function for
+the staircase sweep sources and the pulsed sweep source. The
+automatic abort function stops the measurement when one of the
+following conditions occurs:
+ - Compliance on the measurement channel
+ - Compliance on the non-measurement channel
+ - Overflow on the AD converter
+ - Oscillation on any channel
+This command also sets the post measurement condition for the sweep
+sources. After the measurement is normally completed, the staircase
+sweep sources force the value specified by the post parameter,
+and the pulsed sweep source forces the pulse base value.
+
+If the measurement is stopped by the automatic abort function,
+the staircase sweep sources force the start value, and the pulsed
+sweep source forces the pulse base value after sweep.
+""")
 
         self.add_parameter(name='post_sweep_voltage_condition',
                            set_cmd=self._set_post_sweep_voltage_condition,
@@ -84,93 +168,88 @@ class IVSweeper(InstrumentChannel):
                            get_parser=constants.WM.Post,
                            vals=vals.Enum(*list(constants.WM.Post)),
                            initial_cache_value=constants.WM.Post.START,
-                           docstring=textwrap.dedent("""
-        Source output value after the measurement is normally completed. If
-        this parameter is not set, the sweep sources force the start value.
-                                 """))
+                           docstring="""
+Source output value after the measurement is normally completed. If
+this parameter is not set, the sweep sources force the start value.
+""")
 
         self.add_parameter(name='hold_time',
-                           initial_value=0.0,
+                           initial_cache_value=0.0,
                            vals=vals.Numbers(0, 655.35),
                            unit='s',
                            parameter_class=GroupParameter,
-                           docstring=textwrap.dedent("""
-                           Hold time (in seconds) that is the
-                           wait time after starting measurement
-                           and before starting delay time for
-                           the first step 0 to 655.35 s, with 10
-                           ms resolution. Numeric expression.
-                          """))
+                           docstring="""
+Hold time (in seconds) that is the
+wait time after starting measurement
+and before starting delay time for
+the first step 0 to 655.35 s, with 10
+ms resolution. Numeric expression.
+""")
 
         self.add_parameter(name='delay',
-                           initial_value=0.0,
+                           initial_cache_value=0.0,
                            vals=vals.Numbers(0, 65.535),
                            unit='s',
                            parameter_class=GroupParameter,
-                           docstring=textwrap.dedent("""
-                           Delay time (in seconds) that is the wait time after
-                           starting to force a step output and before
-                            starting a step measurement. 0 to 65.535 s,
-                            with 0.1 ms resolution. Numeric expression.
-                            """))
+                           docstring="""
+Delay time (in seconds) that is the wait time after
+starting to force a step output and before
+ starting a step measurement. 0 to 65.535 s,
+ with 0.1 ms resolution. Numeric expression.
+""")
 
         self.add_parameter(name='step_delay',
-                           initial_value=0.0,
+                           initial_cache_value=0.0,
                            vals=vals.Numbers(0, 1),
                            unit='s',
                            parameter_class=GroupParameter,
-                           docstring=textwrap.dedent("""
-                            Step delay time (in seconds) that is the wait time
-                            after starting a step measurement and before
-                            starting to force the next step output. 0 to 1 s,
-                            with 0.1 ms resolution. Numeric expression. If
-                            this parameter is not set, step delay will be 0. If
-                            step delay is shorter than the measurement time,
-                            the B1500 waits until the measurement completes,
-                            then forces the next step output.
-                            """))
+                           docstring="""
+Step delay time (in seconds) that is the wait time
+after starting a step measurement and before
+starting to force the next step output. 0 to 1 s,
+with 0.1 ms resolution. Numeric expression. If
+this parameter is not set, step delay will be 0. If
+step delay is shorter than the measurement time,
+the B1500 waits until the measurement completes,
+then forces the next step output.
+""")
 
         self.add_parameter(name='trigger_delay',
-                           initial_value=0.0,
+                           initial_cache_value=0.0,
                            unit='s',
                            parameter_class=GroupParameter,
-                           docstring=textwrap.dedent("""
-                            Step source trigger delay time (in seconds) that
-                            is the wait time after completing a step output
-                            setup and before sending a step output setup
-                            completion trigger. 0 to the value of ``delay`` s,
-                            with 0.1 ms resolution.
-                            If this parameter is not set,
-                            trigger delay will be 0.
-                            """))
+                           docstring="""
+Step source trigger delay time (in seconds) that
+is the wait time after completing a step output
+setup and before sending a step output setup
+completion trigger. 0 to the value of ``delay`` s,
+with 0.1 ms resolution.
+If this parameter is not set,
+trigger delay will be 0.
+""")
 
         self.add_parameter(name='measure_delay',
-                           initial_value=0.0,
+                           initial_cache_value=0.0,
                            unit='s',
                            vals=vals.Numbers(0, 65.535),
                            parameter_class=GroupParameter,
-                           docstring=textwrap.dedent("""
-                           Step measurement trigger delay time (in seconds)
-                           that is the wait time after receiving a start step
-                           measurement trigger and before starting a step
-                           measurement. 0 to 65.535 s, with 0.1 ms resolution.
-                           Numeric expression. If this parameter is not set,
-                           measure delay will be 0.
-                           """))
-
-        self._set_sweep_delays_group = Group(
+                           docstring="""
+Step measurement trigger delay time (in seconds)
+that is the wait time after receiving a start step
+measurement trigger and before starting a step
+measurement. 0 to 65.535 s, with 0.1 ms resolution.
+Numeric expression. If this parameter is not set,
+measure delay will be 0.
+""")
+
+        self._set_sweep_delays_group = _SweepDelaysGroup(
+            parent,
             [self.hold_time,
              self.delay,
              self.step_delay,
              self.trigger_delay,
              self.measure_delay],
-            set_cmd='WT '
-                    '{hold_time},'
-                    '{delay},'
-                    '{step_delay},'
-                    '{trigger_delay},'
-                    '{measure_delay}',
-            get_cmd=self._get_sweep_delays(),
+            set_cmd=_WT_SET_CMD,
             get_parser=self._get_sweep_delays_parser)
 
         self.add_parameter(name='sweep_mode',
@@ -179,14 +258,14 @@ class IVSweeper(InstrumentChannel):
                            vals=vals.Enum(*list(constants.SweepMode)),
                            set_parser=constants.SweepMode,
                            snapshot_get=False,
-                           docstring=textwrap.dedent("""
-                 Sweep mode. Note that Only linear sweep (mode=1 or 3) is
-                 available for the staircase sweep with pulsed bias.
-                     1: Linear sweep (single stair, start to stop.)
-                     2: Log sweep (single stair, start to stop.)
-                     3: Linear sweep (double stair, start to stop to start.)
-                     4: Log sweep (double stair, start to stop to start.)
-                                """))
+                           docstring="""
+Sweep mode. Note that Only linear sweep (mode=1 or 3) is
+available for the staircase sweep with pulsed bias.
+    1: Linear sweep (single stair, start to stop.)
+    2: Log sweep (single stair, start to stop.)
+    3: Linear sweep (double stair, start to stop to start.)
+    4: Log sweep (double stair, start to stop to start.)
+""")
 
         self.add_parameter(name='sweep_range',
                            set_cmd=self._set_sweep_range,
@@ -194,19 +273,19 @@ class IVSweeper(InstrumentChannel):
                            vals=vals.Enum(*list(constants.VOutputRange)),
                            set_parser=constants.VOutputRange,
                            snapshot_get=False,
-                           docstring=textwrap.dedent("""
-        Ranging type for staircase sweep voltage output. Integer expression.
-        See Table 4-4 on page 20. The B1500 usually uses the minimum range
-        that covers both start and stop values to force the staircase sweep
-        voltage. However, if you set `power_compliance` and if the following
-        formulas are true, the B1500 uses the minimum range that covers the
-        output value, and changes the output range dynamically (20 V range or
-        above). Range changing may cause 0 V output in a moment. For the
-        limited auto ranging, the instrument never uses the range less than
-        the specified range.
-         - Icomp > maximum current for the output range
-         - Pcomp/output voltage > maximum current for the output range
-        """))
+                           docstring="""
+Ranging type for staircase sweep voltage output. Integer expression.
+See Table 4-4 on page 20. The B1500 usually uses the minimum range
+that covers both start and stop values to force the staircase sweep
+voltage. However, if you set `power_compliance` and if the following
+formulas are true, the B1500 uses the minimum range that covers the
+output value, and changes the output range dynamically (20 V range or
+above). Range changing may cause 0 V output in a moment. For the
+limited auto ranging, the instrument never uses the range less than
+the specified range.
+ - Icomp > maximum current for the output range
+ - Pcomp/output voltage > maximum current for the output range
+""")
 
         self.add_parameter(name='sweep_start',
                            set_cmd=self._set_sweep_start,
@@ -214,10 +293,10 @@ class IVSweeper(InstrumentChannel):
                            unit='V',
                            vals=vals.Numbers(-25, 25),
                            snapshot_get=False,
-                           docstring=textwrap.dedent("""
-        Start value of the stair case sweep (in V). For the log sweep,
-        start and stop must have the same polarity.
-                                """))
+                           docstring="""
+Start value of the stair case sweep (in V). For the log sweep,
+start and stop must have the same polarity.
+""")
 
         self.add_parameter(name='sweep_end',
                            set_cmd=self._set_sweep_end,
@@ -225,19 +304,19 @@ class IVSweeper(InstrumentChannel):
                            unit='V',
                            vals=vals.Numbers(-25, 25),
                            snapshot_get=False,
-                           docstring=textwrap.dedent("""
-        Stop value of the DC bias sweep (in V). For the log sweep,start and
-        stop must have the same polarity.
-                                """))
+                           docstring="""
+Stop value of the DC bias sweep (in V). For the log sweep,start and
+stop must have the same polarity.
+""")
 
         self.add_parameter(name='sweep_steps',
                            set_cmd=self._set_sweep_steps,
                            get_cmd=self._get_sweep_steps,
                            vals=vals.Ints(1, 1001),
                            snapshot_get=False,
-                           docstring=textwrap.dedent("""
-        Number of steps for staircase sweep. Possible  values from 1 to
-        1001"""))
+                           docstring="""
+Number of steps for staircase sweep. Possible  values from 1 to
+1001""")
 
         self.add_parameter(name='current_compliance',
                            set_cmd=self._set_current_compliance,
@@ -245,17 +324,17 @@ class IVSweeper(InstrumentChannel):
                            unit='A',
                            vals=vals.Numbers(-40, 40),
                            snapshot_get=False,
-                           docstring=textwrap.dedent("""
-        Current compliance (in A). Refer to Manual 2016. See Table 4-7 on
-        page 24, Table 4-9 on page 26, Table 4-12 on page 27, or Table 4-15
-        on page 28 for each measurement resource type. If you do not set
-        current_compliance, the previous value is used.
-        Compliance polarity is automatically set to the same polarity as the
-        output value, regardless of the specified Icomp.
-        If the output value is 0, the compliance polarity is positive. If
-        you set Pcomp, the maximum Icomp value for the measurement resource
-        is allowed, regardless of the output range setting.
-                           """))
+                           docstring="""
+Current compliance (in A). Refer to Manual 2016. See Table 4-7 on
+page 24, Table 4-9 on page 26, Table 4-12 on page 27, or Table 4-15
+on page 28 for each measurement resource type. If you do not set
+current_compliance, the previous value is used.
+Compliance polarity is automatically set to the same polarity as the
+output value, regardless of the specified Icomp.
+If the output value is 0, the compliance polarity is positive. If
+you set Pcomp, the maximum Icomp value for the measurement resource
+is allowed, regardless of the output range setting.
+""")
 
         self.add_parameter(name='power_compliance',
                            set_cmd=self._set_power_compliance,
@@ -263,13 +342,13 @@ class IVSweeper(InstrumentChannel):
                            unit='W',
                            vals=vals.Numbers(0.001, 80),
                            snapshot_get=False,
-                           docstring=textwrap.dedent("""
-        Power compliance (in W). Resolution: 0.001 W. If it is not entered,
-        the power compliance is not set. This parameter is not available for
-        HVSMU. 0.001 to 2 for MPSMU/HRSMU, 0.001 to 20 for HPSMU, 0.001 to
-        40 for HCSMU, 0.001 to 80 for dual HCSMU, 0.001 to 3 for MCSMU,
-        0.001 to 100 for UHVU
-                           """))
+                           docstring="""
+Power compliance (in W). Resolution: 0.001 W. If it is not entered,
+the power compliance is not set. This parameter is not available for
+HVSMU. 0.001 to 2 for MPSMU/HRSMU, 0.001 to 20 for HPSMU, 0.001 to
+40 for HCSMU, 0.001 to 80 for dual HCSMU, 0.001 to 3 for MCSMU,
+0.001 to 100 for UHVU
+""")
 
     def _set_sweep_mode(self, value: constants.SweepMode) -> None:
         self._sweep_step_parameters["sweep_mode"] = value
@@ -344,20 +423,25 @@ class IVSweeper(InstrumentChannel):
         )
         self.write(msg.message)
 
-    @staticmethod
-    def _get_sweep_delays() -> str:
-        msg = MessageBuilder().lrn_query(
-            type_id=constants.LRN.Type.STAIRCASE_SWEEP_MEASUREMENT_SETTINGS
-        )
-        cmd = msg.message
-        return cmd
-
     @staticmethod
     def _get_sweep_delays_parser(response: str) -> Dict[str, float]:
-        match = re.search('WT(?P<hold_time>.+?),(?P<delay>.+?),'
-                          '(?P<step_delay>.+?),(?P<trigger_delay>.+?),'
-                          '(?P<measure_delay>.+?)(;|$)',
-                          response)
+        if _FAST_PARSE:
+            start = response.find('WT')
+            if start < 0:
+                raise ValueError('Sweep delays (WT) not found.')
+            end = response.find(';', start)
+            if end < 0:
+                end = len(response)
+            parts = response[start + 2:end].split(',', 4)
+            if len(parts) != 5:
+                raise ValueError('Sweep delays (WT) not found.')
+            return {'hold_time': float(parts[0]),
+                    'delay': float(parts[1]),
+                    'step_delay': float(parts[2]),
+                    'trigger_delay': float(parts[3]),
+                    'measure_delay': float(parts[4])}
+
+        match = _WT_RE.search(response)
         if not match:
             raise ValueError('Sweep delays (WT) not found.')
 
@@ -525,16 +609,16 @@ class _SpotMeasurementVoltageParameter(_ParameterWithStatus):
         smu = cast("B1517A", self.instrument)
 
         if smu._source_config["output_range"] is None:
-            smu._source_config["output_range"] = constants.VOutputRange.AUTO
-        if not isinstance(smu._source_config["output_range"],
-                          constants.VOutputRange):
+            smu._source_config["output_range"] = _V_OUTPUT_RANGE_AUTO
+            smu._source_output_kind = 'v'
+        if smu._source_output_kind != 'v':
             raise TypeError(
                 "Asking to force voltage, but source_config contains a "
                 "current output range"
             )
-        msg = MessageBuilder().dv(
+        msg = smu._fresh_message_builder().dv(
             chnum=smu.channels[0],
-            v_range=smu._source_config["output_range"],
+            v_range=cast(VOutputRange, smu._source_config["output_range"]),
             voltage=value,
             i_comp=smu._source_config["compliance"],
             comp_polarity=smu._source_config["compl_polarity"],
@@ -550,7 +634,7 @@ class _SpotMeasurementVoltageParameter(_ParameterWithStatus):
     def get_raw(self) -> ParamRawDataType:
         smu = cast("B1517A", self.instrument)
 
-        msg = MessageBuilder().tv(
+        msg = smu._fresh_message_builder().tv(
             chnum=smu.channels[0],
             v_range=smu._measure_config["v_measure_range"],
         )
@@ -568,16 +652,16 @@ class _SpotMeasurementCurrentParameter(_ParameterWithStatus):
         smu = cast("B1517A", self.instrument)
 
         if smu._source_config["output_range"] is None:
-            smu._source_config["output_range"] = constants.IOutputRange.AUTO
-        if not isinstance(smu._source_config["output_range"],
-                          constants.IOutputRange):
+            smu._source_config["output_range"] = _I_OUTPUT_RANGE_AUTO
+            smu._source_output_kind = 'i'
+        if smu._source_output_kind != 'i':
             raise TypeError(
                 "Asking to force current, but source_config contains a "
                 "voltage output range"
             )
-        msg = MessageBuilder().di(
+        msg = smu._fresh_message_builder().di(
             chnum=smu.channels[0],
-            i_range=smu._source_config["output_range"],
+            i_range=cast(IOutputRange, smu._source_config["output_range"]),
             current=value,
             v_comp=smu._source_config["compliance"],
             comp_polarity=smu._source_config["compl_polarity"],
@@ -593,7 +677,7 @@ class _SpotMeasurementCurrentParameter(_ParameterWithStatus):
     def get_raw(self) -> ParamRawDataType:
         smu = cast("B1517A", self.instrument)
 
-        msg = MessageBuilder().ti(
+        msg = smu._fresh_message_builder().ti(
             chnum=smu.channels[0],
             i_range=smu._measure_config["i_measure_range"],
         )
@@ -625,13 +709,40 @@ class B1517A(B1500Module):
                  slot_nr: int, **kwargs: Any):
         super().__init__(parent, name, slot_nr, **kwargs)
         self.channels = (ChNr(slot_nr),)
+
+        # Sequence number and response of the last batched ``*LRN?``
+        # query. Used by ``_get_status`` to only query the instrument
+        # when the configuration (``_config_seq``) may have changed.
+        self._status_cache: str = ''
+        self._status_cache_seq: int = -1
+        # Time axis cached by ``_get_time_axis``; only recomputed after
+        # the configuration (and hence possibly the timing parameters)
+        # has changed.
+        self._time_axis_cache: Optional[np.ndarray] = None
+        self._time_axis_cache_seq: int = -1
+        # Reusable builder for the commands of this module, cleared via
+        # ``_fresh_message_builder`` before each use; avoids allocating a
+        # new MessageBuilder per set during sweeps.
+        self._message_builder = MessageBuilder()
+
         self._measure_config: Dict[str, Optional[Any]] = {
             k: None for k in ("v_measure_range", "i_measure_range",)}
         self._source_config: Dict[str, Optional[Any]] = {
             k: None for k in ("output_range", "compliance",
                               "compl_polarity", "min_compliance_range")}
+        # Whether the configured output range sources voltage ('v') or
+        # current ('i'), decided once in ``source_config`` so that the
+        # per-force-point setters compare a tag instead of running an
+        # isinstance check on every set.
+        self._source_output_kind: Optional[Literal['v', 'i']] = None
         self._timing_parameters: Dict[str, Optional[Any]] = {
             k: None for k in ("h_bias", "interval", "number", "h_base")}
+        # Plain-attribute mirrors of the timing parameters read by the
+        # shape validators of ``time_axis``/``sampling_measurement_trace``
+        # on every array read; the dict above stays authoritative for
+        # snapshotting.
+        self._interval: Optional[float] = None
+        self._number: Optional[int] = None
 
         # We want to snapshot these configuration dictionaries
         self._meta_attrs += ['_measure_config', '_source_config',
@@ -697,14 +808,14 @@ class B1517A(B1500Module):
             set_parser=MM.Mode,
             vals=vals.Enum(*list(MM.Mode)),
             initial_cache_value=MM.Mode.SPOT,
-            docstring=textwrap.dedent("""
-                Set measurement mode for this module.
+            docstring="""
+Set measurement mode for this module.
 
-                It is recommended for this parameter to use values from
-                :class:`.constants.MM.Mode` enumeration.
+It is recommended for this parameter to use values from
+:class:`.constants.MM.Mode` enumeration.
 
-                Refer to the documentation of ``MM`` command in the
-                programming guide for more information.""")
+Refer to the documentation of ``MM`` command in the
+programming guide for more information."""
         )
         # Instrument is initialized with this setting having value of
         # `1`, spot measurement mode, hence let's set the parameter's cache to
@@ -717,11 +828,11 @@ class B1517A(B1500Module):
             get_cmd=self._get_measurement_operation_mode,
             set_parser=constants.CMM.Mode,
             vals=vals.Enum(*list(constants.CMM.Mode)),
-            docstring=textwrap.dedent("""
-            The methods sets the SMU measurement operation mode. This
-            is not available for the high speed spot measurement.
-            mode : SMU measurement operation mode. `constants.CMM.Mode`
-            """)
+            docstring="""
+The methods sets the SMU measurement operation mode. This
+is not available for the high speed spot measurement.
+mode : SMU measurement operation mode. `constants.CMM.Mode`
+"""
 
         )
         self.add_parameter(
@@ -760,14 +871,14 @@ class B1517A(B1500Module):
             get_cmd=self._get_current_measurement_range,
             vals=vals.Enum(*list(constants.IMeasRange)),
             set_parser=constants.IMeasRange,
-            docstring=textwrap.dedent("""
-            This method specifies the current measurement range or ranging
-            type.In the initial setting, the auto ranging is set. The range
-            changing occurs immediately after the trigger (that is, during
-            the measurements). Current measurement channel can be decided by
-             the `measurement_operation_mode` method setting and the channel
-            output mode (voltage or current).
-        """))
+            docstring="""
+This method specifies the current measurement range or ranging
+type.In the initial setting, the auto ranging is set. The range
+changing occurs immediately after the trigger (that is, during
+the measurements). Current measurement channel can be decided by
+ the `measurement_operation_mode` method setting and the channel
+output mode (voltage or current).
+""")
 
         self.add_parameter(
             name="enable_filter",
@@ -776,59 +887,101 @@ class B1517A(B1500Module):
             snapshot_get=False,
             vals=vals.Bool(),
             initial_cache_value=False,
-            docstring=textwrap.dedent("""
-            This methods sets the connection mode of a SMU filter for each
-            channel. A filter is mounted on the SMU. It assures clean source
-            output with no spikes or overshooting.
-            ``False``, meaning "disconnect" is the initial setting. Set to
-            ``True`` to connect.
-            """)
+            docstring="""
+This methods sets the connection mode of a SMU filter for each
+channel. A filter is mounted on the SMU. It assures clean source
+output with no spikes or overshooting.
+``False``, meaning "disconnect" is the initial setting. Set to
+``True`` to connect.
+"""
 
         )
 
+    def write(self, cmd: str) -> None:
+        # Any command written to the instrument may change the
+        # configuration that the cached ``*LRN?`` snapshot reflects.
+        self._config_seq += 1
+        super().write(cmd)
+
+    def _fresh_message_builder(self) -> MessageBuilder:
+        """Return the module's reusable :class:`MessageBuilder`, emptied."""
+        self._message_builder.clear_message_queue()
+        return self._message_builder
+
+    def _get_status(self) -> str:
+        """
+        Query the configuration state of this SMU in a single transaction.
+
+        The ``*LRN?`` queries for the measurement ranging status, the SMU
+        measurement operation mode and the staircase sweep measurement
+        settings are composed into one message so that one round-trip to
+        the instrument serves all the parameters that are read from those
+        responses. The concatenated response is cached and reused until a
+        command is written to the instrument.
+        """
+        if self._status_cache_seq != self._config_seq:
+            self._status_cache = self.ask(_STATUS_QUERY)
+            self._status_cache_seq = self._config_seq
+        return self._status_cache
+
     def _get_number_of_samples(self) -> int:
-        if self._timing_parameters['number'] is not None:
-            sample_number = self._timing_parameters['number']
-            return sample_number
-        else:
+        if self._number is None:
             raise Exception('set timing parameters first')
+        return self._number
 
     def _get_time_axis(self) -> np.ndarray:
-        sample_rate = self._timing_parameters['interval']
-        total_time = self._total_measurement_time()
-        time_xaxis = np.arange(0, total_time, sample_rate)
+        if (self._time_axis_cache is not None
+                and self._time_axis_cache_seq == self._config_seq):
+            return self._time_axis_cache
+        if self._interval is None:
+            raise Exception('set timing parameters first')
+        sample_number = self._get_number_of_samples()
+        sample_rate = self._interval
+        # ``np.linspace`` guarantees exactly ``sample_number`` points,
+        # matching the declared shape of the parameter, whereas
+        # ``np.arange`` with a float step may be off by one point due to
+        # accumulated rounding.
+        time_xaxis = np.linspace(0, sample_rate * sample_number,
+                                 sample_number, endpoint=False)
+        # The cached array is handed out to every caller, so protect it
+        # against in-place modification.
+        time_xaxis.setflags(write=False)
+        self._time_axis_cache = time_xaxis
+        self._time_axis_cache_seq = self._config_seq
         return time_xaxis
 
     def _total_measurement_time(self) -> float:
-        if self._timing_parameters['interval'] is None or \
-                self._timing_parameters['number'] is None:
+        if self._interval is None or self._number is None:
             raise Exception('set timing parameters first')
-
-        sample_number = self._timing_parameters['number']
-        sample_rate = self._timing_parameters['interval']
-        total_time = float(sample_rate * sample_number)
-        return total_time
+        return float(self._interval * self._number)
 
     def _set_current_measurement_range(
             self,
             i_range: Union[constants.IMeasRange, int]
         ) -> None:
-        msg = MessageBuilder().ri(chnum=self.channels[0],
-                                  i_range=i_range)
+        msg = self._fresh_message_builder().ri(chnum=self.channels[0],
+                                               i_range=i_range)
         self.write(msg.message)
 
     def _get_current_measurement_range(self) -> \
             List[Tuple[constants.ChNr, constants.IMeasRange]]:
-        response = self.ask(MessageBuilder().lrn_query(
-            type_id=constants.LRN.Type.MEASUREMENT_RANGING_STATUS).message)
-        match = re.findall(r'RI (.+?),(.+?)($|;)', response)
-        response_list = [(constants.ChNr(int(i)),
-                          constants.IMeasRange(int(j)))
+        response = self._get_status()
+        if _FAST_PARSE:
+            response_list = []
+            for record in response.split(';'):
+                if record.startswith('RI '):
+                    chnum, i_range = record[3:].split(',', 1)
+                    response_list.append((_CHNR_BY_VALUE[int(chnum)],
+                                          _IMEAS_RANGE_BY_VALUE[int(i_range)]))
+            return response_list
+        match = _RI_RE.findall(response)
+        response_list = [(_CHNR_BY_VALUE[int(i)],
+                          _IMEAS_RANGE_BY_VALUE[int(j)])
                          for i, j, _ in match]
         return response_list
 
     def _set_measurement_mode(self, mode: Union[MM.Mode, int]) -> None:
-        self.write(MessageBuilder()
+        self.write(self._fresh_message_builder()
                    .mm(mode=mode,
                        channels=[self.channels[0]])
                    .message)
@@ -836,18 +989,25 @@ class B1517A(B1500Module):
     def _set_measurement_operation_mode(self,
                                         mode: Union[constants.CMM.Mode, int]
                                         ) -> None:
-        self.write(MessageBuilder()
+        self.write(self._fresh_message_builder()
                    .cmm(mode=mode,
                         chnum=self.channels[0])
                    .message)
 
     def _get_measurement_operation_mode(self) \
             -> List[Tuple[constants.ChNr, constants.CMM.Mode]]:
-        response = self.ask(MessageBuilder().lrn_query(
-            type_id=constants.LRN.Type.SMU_MEASUREMENT_OPERATION).message)
-        match = re.findall(r'CMM (.+?),(.+?)($|;)', response)
-        response_list = [(constants.ChNr(int(i)),
-                          constants.CMM.Mode(int(j)))
+        response = self._get_status()
+        if _FAST_PARSE:
+            response_list = []
+            for record in response.split(';'):
+                if record.startswith('CMM '):
+                    chnum, mode = record[4:].split(',', 1)
+                    response_list.append((_CHNR_BY_VALUE[int(chnum)],
+                                          _CMM_MODE_BY_VALUE[int(mode)]))
+            return response_list
+        match = _CMM_RE.findall(response)
+        response_list = [(_CHNR_BY_VALUE[int(i)],
+                          _CMM_MODE_BY_VALUE[int(j)])
                          for i, j, _ in match]
         return response_list
 
@@ -905,12 +1065,22 @@ class B1517A(B1500Module):
                     "Invalid Source Current Output Range"
                 )
 
-        self._source_config = {
-            "output_range": output_range,
-            "compliance": compliance,
-            "compl_polarity": compl_polarity,
-            "min_compliance_range": min_compliance_range,
-        }
+        # Update in place rather than rebinding a new dict: the dict is
+        # referenced by ``_meta_attrs`` for snapshotting, and the bumped
+        # ``_config_seq`` marks the configuration change for the caches
+        # keyed on it.
+        source_config = self._source_config
+        source_config["output_range"] = output_range
+        source_config["compliance"] = compliance
+        source_config["compl_polarity"] = compl_polarity
+        source_config["min_compliance_range"] = min_compliance_range
+        if isinstance(output_range, VOutputRange):
+            self._source_output_kind = 'v'
+        elif isinstance(output_range, IOutputRange):
+            self._source_output_kind = 'i'
+        else:
+            self._source_output_kind = None
+        self._config_seq += 1
 
     @deprecate(reason='the method confuses ranges for voltage and current '
                       'measurements',
@@ -946,6 +1116,7 @@ class B1517A(B1500Module):
                                f"ranges are {self._valid_v_measure_ranges}.")
 
         self._measure_config["v_measure_range"] = v_measure_range
+        self._config_seq += 1
 
     def i_measure_range_config(self,
                                i_measure_range: constants.IMeasRange) -> None:
@@ -964,6 +1135,7 @@ class B1517A(B1500Module):
                                f"ranges are {self._valid_i_measure_ranges}.")
 
         self._measure_config["i_measure_range"] = i_measure_range
+        self._config_seq += 1
 
     def timing_parameters(self,
                           h_bias: float,
@@ -1010,7 +1182,9 @@ class B1517A(B1500Module):
                                        interval=interval,
                                        number=number,
                                        h_base=h_base)
-        self.write(MessageBuilder()
+        self._interval = interval
+        self._number = number
+        self.write(self._fresh_message_builder()
                    .mt(h_bias=h_bias,
                        interval=interval,
                        number=number,
@@ -1019,14 +1193,14 @@ class B1517A(B1500Module):
 
     def use_high_speed_adc(self) -> None:
         """Use high-speed ADC type for this module/channel"""
-        self.write(MessageBuilder()
+        self.write(self._fresh_message_builder()
                    .aad(chnum=self.channels[0],
                         adc_type=AAD.Type.HIGH_SPEED)
                    .message)
 
     def use_high_resolution_adc(self) -> None:
         """Use high-resolution ADC type for this module/channel"""
-        self.write(MessageBuilder()
+        self.write(self._fresh_message_builder()
                    .aad(chnum=self.channels[0],
                         adc_type=AAD.Type.HIGH_RESOLUTION)
                    .message)
@@ -1057,7 +1231,8 @@ class B1517A(B1500Module):
                 `constants.AV.Mode.MANUAL`: Manual mode.
                 Number of samples = number
         """
-        self.write(MessageBuilder().av(number=number, mode=mode).message)
+        self.write(self._fresh_message_builder()
+                   .av(number=number, mode=mode).message)
         self._average_coefficient = number
 
     def setup_staircase_sweep(
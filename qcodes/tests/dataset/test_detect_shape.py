@@ -1,3 +1,7 @@
+import functools
+import operator
+from typing import Iterator
+
 import hypothesis.strategies as hst
 import numpy as np
 import pytest
@@ -7,6 +11,7 @@ from qcodes.dataset.descriptions.detect_shapes import \
     detect_shape_of_measurement
 from qcodes.instrument.parameter import Parameter
 from qcodes.tests.instrument_mocks import (ArraySetPointParam,
+                                           DummyChannelInstrument,
                                            Multi2DSetPointParam,
                                            Multi2DSetPointParam2Sizes,
                                            MultiSetPointParam)
@@ -14,58 +19,96 @@ from qcodes.utils.validators import Arrays
 
 from .conftest import ArrayshapedParam
 
-
-@given(loop_shape=hst.lists(hst.integers(min_value=1), min_size=1, max_size=10))
+# Shared loop-shape strategies, defined once at module level so that
+# Hypothesis reuses the strategy objects (and their example caches)
+# across all tests in this module.
+_loop_shape_any = hst.lists(hst.integers(min_value=1),
+                            min_size=1, max_size=10)
+_loop_shape = hst.lists(hst.integers(min_value=1, max_value=1000),
+                        min_size=1, max_size=10)
+# For tests that materialize one sequence per loop dimension via
+# ``range_func``: cap the total number of elements so that a single
+# Hypothesis example cannot demand huge allocations.
+_bounded_loop_shape = _loop_shape.filter(
+    lambda shape: functools.reduce(operator.mul, shape, 1) <= 10_000)
+
+
+@pytest.fixture(name='dummyinstrument', scope='module')
+def _make_dummy_instrument() -> Iterator[DummyChannelInstrument]:
+    # Overrides the function-scoped fixture from conftest with a
+    # module-scoped one: instrument construction is comparatively heavy,
+    # and Hypothesis runs each test body many times. The tests only
+    # mutate ``dummy_n_points`` between examples and set it themselves.
+    inst = DummyChannelInstrument('dummyinstrument')
+    try:
+        yield inst
+    finally:
+        inst.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _make_param(cls):
+    # The dummy multiparameters are stateless, so a single instance per
+    # type can be reused across all Hypothesis examples instead of
+    # constructing a fresh one per example.
+    return cls(name='meas_param')
+
+
+@given(loop_shape=_loop_shape_any)
 def test_get_shape_for_parameter_from_len(loop_shape):
     a = Parameter(name='a', initial_cache_value=10)
+    loop_shape_tuple = tuple(loop_shape)
     shape = detect_shape_of_measurement((a,), loop_shape)
-    assert shape == {'a': tuple(loop_shape)}
+    assert shape == {'a': loop_shape_tuple}
 
 
-@given(loop_shape=hst.lists(hst.integers(min_value=1, max_value=1000),
-                            min_size=1, max_size=10))
+@given(loop_shape=_bounded_loop_shape)
 @pytest.mark.parametrize("range_func", [range, np.arange])
 def test_get_shape_for_parameter_from_sequence(loop_shape, range_func):
     a = Parameter(name='a', initial_cache_value=10)
+    loop_shape_tuple = tuple(loop_shape)
     loop_sequence = tuple(range_func(x) for x in loop_shape)
     shape = detect_shape_of_measurement((a,), loop_sequence)
-    assert shape == {'a': tuple(loop_shape)}
+    assert shape == {'a': loop_shape_tuple}
 
 
-@given(loop_shape=hst.lists(hst.integers(min_value=1), min_size=1, max_size=10))
+@given(loop_shape=_loop_shape_any)
 def test_get_shape_for_array_parameter_from_len(loop_shape):
     a = ArraySetPointParam(name='a')
+    loop_shape_tuple = tuple(loop_shape)
     shape = detect_shape_of_measurement((a,), loop_shape)
-    expected_shape = tuple(loop_shape) + tuple(a.shape)
+    expected_shape = loop_shape_tuple + tuple(a.shape)
     assert shape == {'a': expected_shape}
 
 
-@given(loop_shape=hst.lists(hst.integers(min_value=1, max_value=1000),
-                            min_size=1, max_size=10))
+@given(loop_shape=_bounded_loop_shape)
 @pytest.mark.parametrize("range_func", [range, np.arange])
 def test_get_shape_for_array_parameter_from_shape(loop_shape, range_func):
     a = ArraySetPointParam(name='a')
+    loop_shape_tuple = tuple(loop_shape)
     loop_sequence = tuple(range_func(x) for x in loop_shape)
     shape = detect_shape_of_measurement((a,), loop_sequence)
-    expected_shape = tuple(loop_shape) + tuple(a.shape)
+    expected_shape = loop_shape_tuple + tuple(a.shape)
     assert shape == {'a': expected_shape}
 
 
-@given(loop_shape=hst.lists(hst.integers(min_value=1), min_size=1, max_size=10))
+@given(loop_shape=_loop_shape_any)
 @pytest.mark.parametrize("multiparamtype", [MultiSetPointParam,
                                             Multi2DSetPointParam,
                                             Multi2DSetPointParam2Sizes])
 def test_get_shape_for_multiparam_from_len(loop_shape, multiparamtype):
-    param = multiparamtype(name='meas_param')
+    param = _make_param(multiparamtype)
+    names = param.full_names
+    param_shapes = param.shapes
     shapes = detect_shape_of_measurement((param,), loop_shape)
+    loop_shape_tuple = tuple(loop_shape)
     expected_shapes = {}
-    for i, name in enumerate(param.full_names):
-        expected_shapes[name] = tuple(loop_shape) + tuple(param.shapes[i])
+    for i, name in enumerate(names):
+        expected_shapes[name] = loop_shape_tuple + tuple(param_shapes[i])
     assert shapes == expected_shapes
 
 
-@given(loop_shape=hst.lists(hst.integers(min_value=1, max_value=1000),
-                            min_size=1, max_size=10))
+@given(loop_shape=_bounded_loop_shape)
 @pytest.mark.parametrize("multiparamtype", [MultiSetPointParam,
                                             Multi2DSetPointParam,
                                             Multi2DSetPointParam2Sizes])
@@ -75,25 +118,29 @@ def test_get_shape_for_multiparam_from_shape(
         multiparamtype,
         range_func
 ):
-    param = multiparamtype(name='meas_param')
+    param = _make_param(multiparamtype)
+    names = param.full_names
+    param_shapes = param.shapes
     loop_sequence = tuple(range_func(x) for x in loop_shape)
     shapes = detect_shape_of_measurement((param,), loop_sequence)
+    loop_shape_tuple = tuple(loop_shape)
     expected_shapes = {}
-    for i, name in enumerate(param.full_names):
-        expected_shapes[name] = tuple(loop_shape) + tuple(param.shapes[i])
+    for i, name in enumerate(names):
+        expected_shapes[name] = loop_shape_tuple + tuple(param_shapes[i])
     assert shapes == expected_shapes
 
 
 @settings(suppress_health_check=(HealthCheck.function_scoped_fixture,))
-@given(loop_shape=hst.lists(hst.integers(min_value=1), min_size=1, max_size=10),
+@given(loop_shape=_loop_shape_any,
        n_points=hst.integers(min_value=1, max_value=1000))
 def test_get_shape_for_pws_from_len(dummyinstrument, loop_shape, n_points):
     param = dummyinstrument.A.dummy_parameter_with_setpoints
     dummyinstrument.A.dummy_n_points(n_points)
+    loop_shape_tuple = tuple(loop_shape)
     shapes = detect_shape_of_measurement((param,), loop_shape)
 
     expected_shapes = {}
-    expected_shapes[param.full_name] = (tuple(loop_shape) +
+    expected_shapes[param.full_name] = (loop_shape_tuple +
                                         tuple(param.vals.shape))
     assert shapes == expected_shapes
     assert (dummyinstrument.A.dummy_n_points(),) == param.vals.shape
@@ -102,43 +149,35 @@ def test_get_shape_for_pws_from_len(dummyinstrument, loop_shape, n_points):
 @settings(suppress_health_check=(HealthCheck.function_scoped_fixture,))
 @pytest.mark.parametrize("range_func", [range, np.arange])
 @given(
-    loop_shape=hst.lists(
-        hst.integers(min_value=1, max_value=1000),
-        min_size=1,
-        max_size=10
-    ),
+    loop_shape=_bounded_loop_shape,
     n_points=hst.integers(min_value=1, max_value=1000)
 )
 def test_get_shape_for_pws_from_shape(dummyinstrument, loop_shape, range_func,
                                       n_points):
     param = dummyinstrument.A.dummy_parameter_with_setpoints
     dummyinstrument.A.dummy_n_points(n_points)
+    loop_shape_tuple = tuple(loop_shape)
     loop_sequence = tuple(range_func(x) for x in loop_shape)
     shapes = detect_shape_of_measurement((param,), loop_sequence)
     expected_shapes = {}
-    expected_shapes[param.full_name] = (tuple(loop_shape) +
+    expected_shapes[param.full_name] = (loop_shape_tuple +
                                         tuple(param.vals.shape))
     assert shapes == expected_shapes
     assert (dummyinstrument.A.dummy_n_points(),) == param.vals.shape
 
 
-@given(
-    loop_shape=hst.lists(
-        hst.integers(min_value=1, max_value=1000),
-        min_size=1,
-        max_size=10
-    )
-)
+@given(loop_shape=_loop_shape)
 def test_get_shape_for_param_with_array_validator_from_shape(
         loop_shape):
     param = ArrayshapedParam(name='paramwitharrayval', vals=Arrays(shape=(10,)))
 
+    loop_shape_tuple = tuple(loop_shape)
     shapes = detect_shape_of_measurement((param,), loop_shape)
-    assert shapes == {"paramwitharrayval": tuple(loop_shape) + param.vals.shape}
+    assert shapes == {"paramwitharrayval": loop_shape_tuple + param.vals.shape}
 
 
 @settings(suppress_health_check=(HealthCheck.function_scoped_fixture,))
-@given(loop_shape=hst.lists(hst.integers(min_value=1), min_size=1, max_size=10),
+@given(loop_shape=_loop_shape_any,
        n_points_1=hst.integers(min_value=1, max_value=1000),
        n_points_2=hst.integers(min_value=1, max_value=1000))
 def test_get_shape_for_multiple_parameters(dummyinstrument, loop_shape,
@@ -147,12 +186,13 @@ def test_get_shape_for_multiple_parameters(dummyinstrument, loop_shape,
     dummyinstrument.A.dummy_n_points(n_points_1)
     param2 = dummyinstrument.B.dummy_parameter_with_setpoints
     dummyinstrument.B.dummy_n_points(n_points_2)
+    loop_shape_tuple = tuple(loop_shape)
     shapes = detect_shape_of_measurement((param1, param2), loop_shape)
 
     expected_shapes = {}
-    expected_shapes[param1.full_name] = (tuple(loop_shape) +
+    expected_shapes[param1.full_name] = (loop_shape_tuple +
                                          tuple(param1.vals.shape))
-    expected_shapes[param2.full_name] = (tuple(loop_shape) +
+    expected_shapes[param2.full_name] = (loop_shape_tuple +
                                          tuple(param2.vals.shape))
     assert shapes == expected_shapes
     assert (dummyinstrument.A.dummy_n_points(),) == param1.vals.shape
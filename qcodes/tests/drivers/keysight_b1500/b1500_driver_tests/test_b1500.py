@@ -299,3 +299,15 @@ def test_error_message_is_called_after_setting_a_parameter(b1500):
     error_string = 'While setting this parameter received error: +200, ' \
                   '"Output channel not enabled"'
     assert e_info.value.args[0] == error_string
+
+
+def test_mainframe_write_invalidates_module_status_caches(b1500):
+    smu = b1500.by_slot[SlotNr.SLOT01]
+    seq_before = smu._config_seq
+
+    # ``reset`` writes through the mainframe, bypassing the modules'
+    # ``write`` methods, but still must invalidate their cached
+    # ``*LRN?``-derived state.
+    b1500.reset()
+
+    assert smu._config_seq > seq_before
@@ -55,6 +55,20 @@ def test_disable_outputs():
     mainframe.write.assert_called_once_with(f'CL {slot_nr}')
 
 
+def test_batched_writes_are_sent_as_one_message():
+    mainframe = MagicMock()
+
+    # Use concrete subclass because B1500Module does not assign channels
+    smu = B1517A(parent=mainframe, name='B1517A', slot_nr=1)
+
+    with smu.batched():
+        smu.use_high_speed_adc()
+        smu.timing_parameters(0.0, 0.42, 32)
+        mainframe.write.assert_not_called()
+
+    mainframe.write.assert_called_once_with('AAD 1,0;MT 0.0,0.42,32')
+
+
 def test_parse_module_query_response():
     response = 'B1517A,0;B1517A,0;B1520A,0;0,0;0,0;0,0;0,0;0,0;0,0;0,0'
     expected = {SlotNr.SLOT01: 'B1517A',
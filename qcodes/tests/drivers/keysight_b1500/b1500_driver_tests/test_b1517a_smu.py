@@ -394,6 +394,35 @@ def test_current_measurement_range(smu):
                          constants.IMeasRange.FIX_1A)]
 
 
+def test_status_getters_share_one_lrn_query(smu):
+    mainframe = smu.parent
+
+    mainframe.ask.return_value = 'RI 1,-20;CMM 1,0;WT1.0,0.0,0.0,0.0,0.0'
+
+    assert smu.current_measurement_range() == [
+        (constants.ChNr.SLOT_01_CH1, constants.IMeasRange.FIX_1A)]
+    assert smu.measurement_operation_mode() == [
+        (constants.ChNr.SLOT_01_CH1, constants.CMM.Mode.COMPLIANCE_SIDE)]
+
+    mainframe.ask.assert_called_once_with('*LRN? 32;*LRN? 46;*LRN? 33')
+
+
+def test_write_invalidates_cached_lrn_response(smu):
+    mainframe = smu.parent
+
+    mainframe.ask.return_value = 'RI 1,-20;CMM 1,0'
+    smu.current_measurement_range()
+    smu.current_measurement_range()
+    assert mainframe.ask.call_count == 1
+
+    smu.current_measurement_range(constants.IMeasRange.AUTO)
+
+    mainframe.ask.return_value = 'RI 1,0;CMM 1,0'
+    assert smu.current_measurement_range() == [
+        (constants.ChNr.SLOT_01_CH1, constants.IMeasRange.AUTO)]
+    assert mainframe.ask.call_count == 2
+
+
 def test_get_sweep_mode_range_start_end_steps(smu):
     mainframe = smu.parent
     mainframe.ask.return_value = 'WV1,1,50,+3.0E+00,-3.0E+00,201'